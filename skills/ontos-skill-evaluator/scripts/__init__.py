@@ -0,0 +1,6 @@
+"""
+Skill Evaluator - Python scripts
+=================================
+quick_eval (evaluation engine), visualize (HTML reports) and pipeline_hook
+(quality gate for generation pipelines).
+"""
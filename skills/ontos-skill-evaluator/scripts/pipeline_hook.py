@@ -16,18 +16,62 @@ Usage:
         print(f"Skill needs improvement: {result.issues}")
 """
 
-import sys
+import asyncio
+import hashlib
+import json
+import os
+import tempfile
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional
 
-# Add parent to path for imports
-sys.path.insert(0, str(Path(__file__).parent))
+try:
+    from .quick_eval import evaluate_skill, EvaluationReport
+except ImportError:
+    # Run as a script: sibling modules resolve from the script's directory
+    from quick_eval import evaluate_skill, EvaluationReport
 
-from quick_eval import evaluate_skill, EvaluationReport
 
+@lru_cache(maxsize=None)
+def _load_html_renderer():
+    """Import visualize on first use and reuse it across evaluations."""
+    try:
+        from .visualize import generate_html_report_stream
+    except ImportError:
+        from visualize import generate_html_report_stream
+    return generate_html_report_stream
 
-@dataclass
+
+def _cache_key(skill_path: Path) -> Optional[str]:
+    """
+    Key for a skill's cached report, or None if SKILL.md can't be read.
+
+    Combines the SKILL.md content hash, the skill path, (relative path, mtime,
+    size) of every file under the skill, and the evaluator module's mtime so
+    reports are recomputed after the scoring code changes.
+    """
+    try:
+        digest = hashlib.blake2b((skill_path / "SKILL.md").read_bytes(), digest_size=16)
+    except OSError:
+        return None
+
+    files = []
+    for root, _, names in os.walk(skill_path):
+        for name in names:
+            file_path = os.path.join(root, name)
+            try:
+                st = os.stat(file_path)
+            except OSError:
+                continue  # Dangling symlink or file removed mid-walk
+            files.append((os.path.relpath(file_path, skill_path), st.st_mtime_ns, st.st_size))
+
+    evaluator_mtime = os.stat(evaluate_skill.__code__.co_filename).st_mtime_ns
+    digest.update(repr((str(skill_path), sorted(files), evaluator_mtime)).encode("utf-8"))
+    return digest.hexdigest()
+
+
+@dataclass(slots=True)
 class SkillQualityResult:
     """Result of skill quality evaluation."""
     passed: bool
@@ -52,7 +96,8 @@ class SkillQualityGate:
         self, 
         min_score: float = 0.5,
         generate_report: bool = True,
-        report_output_dir: Optional[Path] = None
+        report_output_dir: Optional[Path] = None,
+        cache_dir: Optional[Path] = None
     ):
         """
         Initialize quality gate.
@@ -61,10 +106,49 @@ class SkillQualityGate:
             min_score: Minimum overall score to pass (0.0-1.0)
             generate_report: Whether to generate HTML visual report
             report_output_dir: Where to save HTML reports (default: skill's parent dir)
+            cache_dir: Where to cache reports of unchanged skills (default: no cache)
         """
         self.min_score = min_score
         self.generate_report = generate_report
         self.report_output_dir = report_output_dir
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+
+    def _evaluate_cached(self, skill_path: Path) -> EvaluationReport:
+        """Run evaluate_skill, reusing the cached report if the skill is unchanged."""
+        if self.cache_dir is None:
+            return evaluate_skill(skill_path)
+
+        skill_path = Path(skill_path).resolve()
+        key = _cache_key(skill_path)
+        if key is None:
+            return evaluate_skill(skill_path)
+
+        cache_path = self.cache_dir / f"{key}.json"
+        try:
+            return EvaluationReport.from_dict(json.loads(cache_path.read_text(encoding="utf-8")))
+        except (OSError, ValueError, KeyError, TypeError):
+            pass  # Missing or unreadable entry: evaluate and rewrite it
+
+        report = evaluate_skill(skill_path)
+        self._save_cached(cache_path, report)
+        return report
+
+    def _save_cached(self, cache_path: Path, report: EvaluationReport) -> None:
+        """Atomically write a cache entry; the cache is optional, so failures are ignored."""
+        tmp_path = None
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Unique per call, so concurrent threads never share a temp file
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(report.to_json())
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
     
     def evaluate(self, skill_path: Path) -> SkillQualityResult:
         """
@@ -76,8 +160,8 @@ class SkillQualityGate:
         Returns:
             SkillQualityResult with pass/fail status and details
         """
-        skill_path = Path(skill_path).resolve()
-        report = evaluate_skill(skill_path)
+        report = self._evaluate_cached(skill_path)
+        skill_path = Path(report.skill_path)  # already resolved by evaluate_skill
         
         # Determine pass/fail
         passed = report.scores.overall >= self.min_score
@@ -102,10 +186,8 @@ class SkillQualityGate:
         # Generate HTML report if requested
         if self.generate_report:
             try:
-                from visualize import generate_html_report
-                
-                html_content = generate_html_report(report.to_dict())
-                
+                generate_html_report_stream = _load_html_renderer()
+
                 if self.report_output_dir:
                     output_dir = Path(self.report_output_dir)
                 else:
@@ -113,7 +195,16 @@ class SkillQualityGate:
                 
                 output_dir.mkdir(parents=True, exist_ok=True)
                 html_path = output_dir / f"{report.skill_id}_report.html"
-                html_path.write_text(html_content, encoding="utf-8")
+                # Stream into a temp file and swap it in, so a failed render
+                # never leaves an empty or partial report in place of the old one
+                fd, tmp_path = tempfile.mkstemp(dir=output_dir, suffix=".html.tmp")
+                try:
+                    with os.fdopen(fd, "w", encoding="utf-8", buffering=64 * 1024) as fp:
+                        generate_html_report_stream(report.to_dict(), fp)
+                    os.replace(tmp_path, html_path)
+                except BaseException:
+                    os.unlink(tmp_path)
+                    raise
                 result.html_report_path = html_path
                 
             except Exception as e:
@@ -126,7 +217,8 @@ class SkillQualityGate:
 def evaluate_generated_skill(
     skill_path: Path,
     min_score: float = 0.5,
-    generate_report: bool = True
+    generate_report: bool = True,
+    cache_dir: Optional[Path] = None
 ) -> SkillQualityResult:
     """
     Convenience function to evaluate a generated skill.
@@ -135,21 +227,23 @@ def evaluate_generated_skill(
         skill_path: Path to skill directory
         min_score: Minimum score to pass (default: 0.5)
         generate_report: Whether to generate HTML report
+        cache_dir: Where to cache reports of unchanged skills (default: no cache)
         
     Returns:
         SkillQualityResult
     """
     gate = SkillQualityGate(
         min_score=min_score,
-        generate_report=generate_report
+        generate_report=generate_report,
+        cache_dir=cache_dir
     )
     return gate.evaluate(skill_path)
 
 
 # Async wrapper for pipeline integration
 async def async_evaluate_skill(skill_path: Path, min_score: float = 0.5) -> SkillQualityResult:
-    """Async wrapper for skill evaluation (runs synchronously internally)."""
-    return evaluate_generated_skill(skill_path, min_score)
+    """Async wrapper for skill evaluation (runs in the default thread pool)."""
+    return await asyncio.to_thread(evaluate_generated_skill, skill_path, min_score)
 
 
 if __name__ == "__main__":
@@ -16,12 +16,27 @@ import json
 import os
 import re
 import sys
-from dataclasses import dataclass, field, asdict
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
 from typing import Optional
 from urllib.parse import quote
 
+try:
+    import yaml
+    # BaseLoader keeps every scalar as its source text ("yes", "1.10", "0777")
+    _YAML_LOADER = getattr(yaml, "CBaseLoader", yaml.BaseLoader)
+except ImportError:
+    yaml = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # =============================================================================
 # Constants
@@ -33,13 +48,63 @@ TOKEN_LIMITS = {
     "body_lines": {"warn": 300, "error": 500},
     "body_chars": {"warn": 8000, "error": 16000},
 }
+ALLOWED_FRONTMATTER_FIELDS = frozenset({"name", "description", "license", "tags"})
+RESOURCE_DIRS = ("scripts", "references", "assets")
+# Below this many skills, process pool startup costs more than it saves
+BATCH_PARALLEL_MIN = 20
+
+# "Does X appear anywhere in the body?" patterns, answered together by
+# _scan_presence. Compiled with re.MULTILINE; case-insensitive ones use (?i:).
+_PRESENCE_PATTERNS = {
+    "trigger": (
+        r"(?i:##?\s*(?:trigger|usage|invoke|activate)"
+        r"|\*.*trigger.*\*"
+        r'|"[^"]*")'  # Quoted phrases often are triggers
+    ),
+    "steps": (
+        r"^(?:\d+\.\s+"      # 1. Step
+        r"|-\s+"             # - Step
+        r"|\*\s+"            # * Step
+        r"|#{1,3}\s+Step)"   # ## Step
+    ),
+    "code_block": r"```[\s\S]*?```",
+    "doc_ref": r"references?/[\w\-\.]+|\[.*\]\(.*\.md\)",
+    "shell_fence": r"```(?:bash|shell|sh|zsh)",
+    "example_section": r"(?i:##?\s*(?:example|sample|demo))",
+    "output_format": r"##?\s*output|```json|```yaml|\|.*\|.*\|",
+}
+
+_SCRIPT_REF_RE = re.compile(r"scripts?/[\w\-\.]+")
+_PLACEHOLDER_RE = re.compile(
+    r"\[placeholder\]|\[todo\]|\[tbd\]|\[fill in\]"
+    r"|xxx|FIXME|TODO|<your.*>|\.\.\.",
+    re.IGNORECASE,
+)
+
+# Keyword groups, matched against lowercased text. Checks count how many
+# distinct keywords of a group appear (see _count_distinct).
+_USAGE_RE = re.compile(r"use when|use for|triggers|invoke|activate|call this")
+_VAGUE_RE = re.compile(
+    r"as needed|if necessary|when appropriate|as applicable|etc\.|and so on|various"
+)
+_IMPERATIVE_RE = re.compile(
+    r"\b(?:run|execute|create|add|remove|update|check|verify|use)\b"
+)
+_TOOL_KEYWORD_RE = re.compile(r"mcp|tool|api|endpoint|function|command")
+
+
+def _dumps(obj) -> str:
+    """Serialize to 2-space indented JSON, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(obj, indent=2, ensure_ascii=False)
 
 
 # =============================================================================
 # Data Models
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class Issue:
     severity: str  # "error" | "warning" | "info"
     code: str
@@ -47,8 +112,18 @@ class Issue:
     line: Optional[int] = None
     suggestion: Optional[str] = None
 
+    def to_dict(self) -> dict:
+        # Flat dict literal; dataclasses.asdict deep-copies every field
+        return {
+            "severity": self.severity,
+            "code": self.code,
+            "message": self.message,
+            "line": self.line,
+            "suggestion": self.suggestion,
+        }
 
-@dataclass
+
+@dataclass(slots=True)
 class Scores:
     structure: float = 0.0
     triggers: float = 0.0
@@ -68,7 +143,7 @@ class Scores:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenWarning:
     field: str
     current: int
@@ -76,8 +151,17 @@ class TokenWarning:
     severity: str  # "warning" | "error"
     message: str
 
+    def to_dict(self) -> dict:
+        return {
+            "field": self.field,
+            "current": self.current,
+            "limit": self.limit,
+            "severity": self.severity,
+            "message": self.message,
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class EvaluationReport:
     skill_id: str
     skill_path: str
@@ -121,14 +205,34 @@ class EvaluationReport:
                 "examples": round(self.scores.examples, 2),
             },
             # Phase 1: Token Warnings
-            "token_warnings": [asdict(w) if isinstance(w, TokenWarning) else w for w in self.token_warnings],
+            "token_warnings": [w.to_dict() if isinstance(w, TokenWarning) else w for w in self.token_warnings],
             # Issues & Recommendations
-            "issues": [asdict(i) if isinstance(i, Issue) else i for i in self.issues],
+            "issues": [i.to_dict() if isinstance(i, Issue) else i for i in self.issues],
             "recommendations": self.recommendations,
         }
 
     def to_json(self) -> str:
-        return json.dumps(self.to_dict(), indent=2, ensure_ascii=False)
+        return _dumps(self.to_dict())
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "EvaluationReport":
+        """Rebuild a report from to_dict() output (scores come back rounded)."""
+        scores = {k: v for k, v in data.get("scores", {}).items() if k != "overall"}
+        return cls(
+            skill_id=data["skill_id"],
+            skill_path=data["skill_path"],
+            evaluated_at=data["evaluated_at"],
+            tier=data.get("tier", "quick"),
+            is_passed=data.get("is_passed", False),
+            pass_threshold=data.get("pass_threshold", PASS_THRESHOLD),
+            badge=data.get("badge", "fail"),
+            badge_markdown=data.get("badge_markdown", ""),
+            badge_html=data.get("badge_html", ""),
+            scores=Scores(**scores),
+            token_warnings=[TokenWarning(**w) for w in data.get("token_warnings", [])],
+            issues=[Issue(**i) for i in data.get("issues", [])],
+            recommendations=list(data.get("recommendations", [])),
+        )
 
     def to_markdown(self) -> str:
         badge_emoji = {"gold": "🥇", "silver": "🥈", "bronze": "🥉", "fail": "❌"}
@@ -155,7 +259,7 @@ class EvaluationReport:
             lines.append("## Issues")
             lines.append("")
             for issue in self.issues:
-                i = issue if isinstance(issue, dict) else asdict(issue)
+                i = issue if isinstance(issue, dict) else issue.to_dict()
                 severity_icon = {"error": "🔴", "warning": "🟡", "info": "🔵"}.get(i["severity"], "")
                 line_info = f" (line {i['line']})" if i.get("line") else ""
                 lines.append(f"- {severity_icon} **{i['code']}**{line_info}: {i['message']}")
@@ -174,9 +278,42 @@ class EvaluationReport:
 
 
 # =============================================================================
-# YAML Frontmatter Parser (minimal, no external deps)
+# YAML Frontmatter Parser (PyYAML when available, minimal fallback otherwise)
 # =============================================================================
 
+def _load_yaml(frontmatter_text: str) -> dict | None:
+    """Parse frontmatter with PyYAML (libyaml C loader if built). Returns None if unavailable or invalid."""
+    if yaml is None:
+        return None
+    try:
+        data = yaml.load(frontmatter_text, Loader=_YAML_LOADER)
+    except yaml.YAMLError:
+        return None
+    if not isinstance(data, dict):
+        return None
+
+    # Scalars (and empty values) load as str, lists and mappings as-is.
+    # Nested keys (metadata.author) stay inside their parent mapping, so only
+    # the top-level key counts as EXTRA_FIELD -- quick_eval.js, which parses
+    # line by line, flags each nested key too.
+    return data
+
+
+def _parse_simple_yaml(frontmatter_text: str) -> dict:
+    """Line-based key: value parser, tolerant of unquoted colons in values."""
+    frontmatter = {}
+    for line in frontmatter_text.split("\n"):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if ":" in line:
+            key, _, value = line.partition(":")
+            key = key.strip()
+            value = value.strip().strip('"').strip("'")
+            frontmatter[key] = value
+    return frontmatter
+
+
 def parse_frontmatter(content: str) -> tuple[dict | None, str, list[Issue]]:
     """Parse YAML frontmatter from SKILL.md content."""
     issues = []
@@ -201,17 +338,19 @@ def parse_frontmatter(content: str) -> tuple[dict | None, str, list[Issue]]:
                            "Duplicate YAML frontmatter block detected",
                            suggestion="Remove the duplicate --- block"))
 
-    # Simple YAML parsing (key: value)
-    frontmatter = {}
-    for line_num, line in enumerate(frontmatter_text.split("\n"), start=2):
-        line = line.strip()
-        if not line or line.startswith("#"):
-            continue
-        if ":" in line:
-            key, _, value = line.partition(":")
-            key = key.strip()
-            value = value.strip().strip('"').strip("'")
-            frontmatter[key] = value
+    frontmatter = _load_yaml(frontmatter_text)
+    if frontmatter is None:
+        # PyYAML missing or rejected the block (e.g. unquoted colons in description)
+        frontmatter = _parse_simple_yaml(frontmatter_text)
+
+    # YAML may give lists/mappings; the checks treat these fields as text
+    for key in ("name", "description"):
+        value = frontmatter.get(key)
+        if value is not None and not isinstance(value, str):
+            issues.append(Issue("error", "INVALID_FIELD_TYPE",
+                               f"Frontmatter '{key}' must be a string, got {type(value).__name__}",
+                               suggestion=f"Write '{key}' as a single line of text"))
+            frontmatter[key] = ""
 
     return frontmatter, body, issues
 
@@ -220,17 +359,55 @@ def parse_frontmatter(content: str) -> tuple[dict | None, str, list[Issue]]:
 # Evaluation Checks
 # =============================================================================
 
-def check_structure(skill_path: Path, frontmatter: dict | None, body: str, issues: list[Issue]) -> float:
+@lru_cache(maxsize=None)
+def _presence_re(names: frozenset[str]) -> re.Pattern:
+    """Alternation of the named presence patterns, one named group each."""
+    return re.compile(
+        "|".join(f"(?P<{name}>{pattern})" for name, pattern in _PRESENCE_PATTERNS.items() if name in names),
+        re.MULTILINE,
+    )
+
+
+def _scan_presence(body: str) -> set[str]:
+    """Return the names of _PRESENCE_PATTERNS found in body, in one forward pass.
+
+    After each hit the scan resumes at the hit's start with the remaining
+    patterns only, so overlapping matches (e.g. a code fence inside a quoted
+    phrase) give the same answer as searching for each pattern separately.
+    """
+    found = set()
+    remaining = frozenset(_PRESENCE_PATTERNS)
+    pos = 0
+    while remaining:
+        match = _presence_re(remaining).search(body, pos)
+        if match is None:
+            break
+        found.add(match.lastgroup)
+        remaining -= {match.lastgroup}
+        pos = match.start()
+    return found
+
+
+def _count_distinct(pattern: re.Pattern, text: str, stop_at: int | None = None) -> int:
+    """Count distinct matches of pattern in text, stopping the scan once stop_at is reached."""
+    seen = set()
+    for match in pattern.finditer(text):
+        seen.add(match.group())
+        if len(seen) == stop_at:
+            break
+    return len(seen)
+
+
+def check_structure(
+    dir_entries: dict[str, os.DirEntry],
+    frontmatter: dict | None,
+    body: str,
+    issues: list[Issue],
+) -> float:
     """Check structural integrity. Returns score 0-1."""
     score = 1.0
     deductions = []
 
-    # Check SKILL.md exists
-    skill_md = skill_path / "SKILL.md"
-    if not skill_md.exists():
-        issues.append(Issue("error", "NO_SKILL_MD", f"SKILL.md not found in {skill_path}"))
-        return 0.0
-
     # Check frontmatter
     if frontmatter is None:
         return 0.0  # Already logged as error
@@ -245,19 +422,17 @@ def check_structure(skill_path: Path, frontmatter: dict | None, body: str, issue
         deductions.append(0.3)
 
     # Check for illegal fields
-    allowed_fields = {"name", "description", "license", "tags"}
     for key in frontmatter:
-        if key not in allowed_fields:
+        if key not in ALLOWED_FRONTMATTER_FIELDS:
             issues.append(Issue("warning", "EXTRA_FIELD", 
                                f"Frontmatter contains non-standard field: '{key}'",
                                suggestion=f"Remove '{key}' or move to body"))
             deductions.append(0.05)
 
     # Check directory structure
-    expected_dirs = ["scripts", "references", "assets"]
     existing_resources = []
-    for d in expected_dirs:
-        if (skill_path / d).exists():
+    for d in RESOURCE_DIRS:
+        if d in dir_entries:
             existing_resources.append(d)
     
     # Not having subdirs is fine, just informational
@@ -269,7 +444,7 @@ def check_structure(skill_path: Path, frontmatter: dict | None, body: str, issue
     return max(0.0, score - sum(deductions))
 
 
-def check_triggers(frontmatter: dict | None, body: str, issues: list[Issue]) -> float:
+def check_triggers(frontmatter: dict | None, presence: set[str], issues: list[Issue]) -> float:
     """Check trigger quality. Returns score 0-1."""
     score = 0.0
 
@@ -279,10 +454,7 @@ def check_triggers(frontmatter: dict | None, body: str, issues: list[Issue]) ->
     description = frontmatter.get("description", "")
     
     # Check description has usage context
-    usage_keywords = ["use when", "use for", "triggers", "invoke", "activate", "call this"]
-    has_usage_context = any(kw in description.lower() for kw in usage_keywords)
-    
-    if has_usage_context:
+    if _USAGE_RE.search(description.lower()):
         score += 0.4
     else:
         issues.append(Issue("warning", "NO_USAGE_CONTEXT",
@@ -298,19 +470,7 @@ def check_triggers(frontmatter: dict | None, body: str, issues: list[Issue]) ->
         score += 0.2
 
     # Check for explicit trigger phrases in body
-    trigger_patterns = [
-        r"##?\s*(trigger|usage|invoke|activate)",
-        r"\*.*trigger.*\*",
-        r'"[^"]*"',  # Quoted phrases often are triggers
-    ]
-    
-    has_trigger_section = False
-    for pattern in trigger_patterns:
-        if re.search(pattern, body, re.IGNORECASE):
-            has_trigger_section = True
-            break
-
-    if has_trigger_section:
+    if "trigger" in presence:
         score += 0.4
     else:
         issues.append(Issue("info", "NO_TRIGGER_EXAMPLES",
@@ -320,25 +480,12 @@ def check_triggers(frontmatter: dict | None, body: str, issues: list[Issue]) ->
     return min(1.0, score)
 
 
-def check_actionability(body: str, issues: list[Issue]) -> float:
+def check_actionability(body_lower: str, presence: set[str], issues: list[Issue]) -> float:
     """Check if instructions are actionable. Returns score 0-1."""
     score = 0.0
 
     # Check for numbered/bulleted steps
-    step_patterns = [
-        r"^\d+\.\s+",        # 1. Step
-        r"^-\s+",            # - Step
-        r"^\*\s+",           # * Step
-        r"^#{1,3}\s+Step",   # ## Step
-    ]
-    
-    has_steps = False
-    for pattern in step_patterns:
-        if re.search(pattern, body, re.MULTILINE):
-            has_steps = True
-            break
-
-    if has_steps:
+    if "steps" in presence:
         score += 0.35
     else:
         issues.append(Issue("warning", "NO_STEPS",
@@ -346,8 +493,7 @@ def check_actionability(body: str, issues: list[Issue]) -> float:
                            suggestion="Add step-by-step instructions"))
 
     # Check for code blocks (concrete examples)
-    code_blocks = re.findall(r"```[\s\S]*?```", body)
-    if code_blocks:
+    if "code_block" in presence:
         score += 0.25
     else:
         issues.append(Issue("info", "NO_CODE_BLOCKS",
@@ -355,11 +501,7 @@ def check_actionability(body: str, issues: list[Issue]) -> float:
                            suggestion="Add code examples for concrete guidance"))
 
     # Check for vague language
-    vague_phrases = [
-        "as needed", "if necessary", "when appropriate", 
-        "as applicable", "etc.", "and so on", "various"
-    ]
-    vague_count = sum(1 for phrase in vague_phrases if phrase in body.lower())
+    vague_count = _count_distinct(_VAGUE_RE, body_lower)
     
     if vague_count > 3:
         issues.append(Issue("warning", "VAGUE_LANGUAGE",
@@ -370,8 +512,7 @@ def check_actionability(body: str, issues: list[Issue]) -> float:
         score += 0.2
 
     # Check for imperative verbs (good instructions use them)
-    imperative_verbs = ["run", "execute", "create", "add", "remove", "update", "check", "verify", "use"]
-    imperative_count = sum(1 for verb in imperative_verbs if re.search(rf"\b{verb}\b", body, re.IGNORECASE))
+    imperative_count = _count_distinct(_IMPERATIVE_RE, body_lower, stop_at=3)
     
     if imperative_count >= 3:
         score += 0.2
@@ -383,20 +524,30 @@ def check_actionability(body: str, issues: list[Issue]) -> float:
     return max(0.0, min(1.0, score))
 
 
-def check_tool_refs(skill_path: Path, body: str, issues: list[Issue]) -> float:
+def check_tool_refs(
+    skill_path: Path,
+    dir_entries: dict[str, os.DirEntry],
+    body: str,
+    body_lower: str,
+    presence: set[str],
+    issues: list[Issue],
+) -> float:
     """Check tool/resource integration. Returns score 0-1."""
     score = 0.0
 
-    # Check for script references
-    script_refs = re.findall(r"scripts?/[\w\-\.]+", body)
-    scripts_dir = skill_path / "scripts"
-    
-    if scripts_dir.exists() and list(scripts_dir.glob("*")):
+    # Check for script references (deduplicated, first-mention order)
+    script_refs = list(dict.fromkeys(_SCRIPT_REF_RE.findall(body)))
+    scripts_entry = dir_entries.get("scripts")
+    script_names = set(os.listdir(scripts_entry.path)) if scripts_entry and scripts_entry.is_dir() else set()
+
+    if script_names:
         score += 0.3
-        # Verify referenced scripts exist
+        # Verify referenced scripts exist; only stat refs missing from the listing
         for ref in script_refs:
-            ref_path = skill_path / ref
-            if not ref_path.exists():
+            folder, _, name = ref.partition("/")
+            if folder == "scripts" and name in script_names:
+                continue
+            if not (skill_path / ref).exists():
                 issues.append(Issue("error", "BROKEN_SCRIPT_REF",
                                    f"Referenced script not found: {ref}",
                                    suggestion=f"Create {ref} or fix the reference"))
@@ -405,21 +556,17 @@ def check_tool_refs(skill_path: Path, body: str, issues: list[Issue]) -> float:
                            f"Script references found but scripts/ directory missing"))
 
     # Check for reference doc links
-    ref_patterns = [r"references?/[\w\-\.]+", r"\[.*\]\(.*\.md\)"]
-    has_doc_refs = any(re.search(p, body) for p in ref_patterns)
-    
-    if has_doc_refs:
+    if "doc_ref" in presence:
         score += 0.3
     
     # Check for MCP / tool mentions
-    tool_keywords = ["mcp", "tool", "api", "endpoint", "function", "command"]
-    tool_mentions = sum(1 for kw in tool_keywords if kw in body.lower())
+    tool_mentions = _count_distinct(_TOOL_KEYWORD_RE, body_lower, stop_at=2)
     
     if tool_mentions >= 2:
         score += 0.2
     
     # Check for command examples
-    if re.search(r"```(?:bash|shell|sh|zsh)", body):
+    if "shell_fence" in presence:
         score += 0.2
 
     # If no tool integration at all, it's okay for simple skills
@@ -432,20 +579,12 @@ def check_tool_refs(skill_path: Path, body: str, issues: list[Issue]) -> float:
     return min(1.0, score)
 
 
-def check_examples(body: str, issues: list[Issue]) -> float:
+def check_examples(body: str, presence: set[str], issues: list[Issue]) -> float:
     """Check example quality. Returns score 0-1."""
     score = 0.0
 
     # Check for placeholder text
-    placeholder_patterns = [
-        r"\[placeholder\]", r"\[todo\]", r"\[tbd\]", r"\[fill in\]",
-        r"xxx", r"FIXME", r"TODO", r"<your.*>", r"\.\.\."
-    ]
-    
-    placeholder_count = 0
-    for pattern in placeholder_patterns:
-        matches = re.findall(pattern, body, re.IGNORECASE)
-        placeholder_count += len(matches)
+    placeholder_count = len(_PLACEHOLDER_RE.findall(body))
 
     if placeholder_count == 0:
         score += 0.4
@@ -459,20 +598,14 @@ def check_examples(body: str, issues: list[Issue]) -> float:
                            f"Found {placeholder_count} placeholders - skill may be incomplete"))
 
     # Check for example sections
-    example_patterns = [r"##?\s*example", r"##?\s*sample", r"##?\s*demo"]
-    has_example_section = any(re.search(p, body, re.IGNORECASE) for p in example_patterns)
-    
-    if has_example_section:
+    if "example_section" in presence:
         score += 0.3
     else:
         issues.append(Issue("info", "NO_EXAMPLE_SECTION",
                            "No dedicated Examples section found"))
 
     # Check for output format examples
-    output_patterns = [r"##?\s*output", r"```json", r"```yaml", r"\|.*\|.*\|"]
-    has_output_format = any(re.search(p, body) for p in output_patterns)
-    
-    if has_output_format:
+    if "output_format" in presence:
         score += 0.3
     else:
         issues.append(Issue("info", "NO_OUTPUT_FORMAT",
@@ -581,27 +714,60 @@ def generate_badge_markdown(badge: str, skill_id: str) -> tuple[str, str]:
 # Main Evaluation
 # =============================================================================
 
-def evaluate_skill(skill_path: Path, verbose: bool = False) -> EvaluationReport:
-    """Run Quick Eval on a skill and return report."""
+def _utc_timestamp() -> str:
+    """Current UTC time as ISO 8601 with a 'Z' suffix."""
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def _read_skill_md(skill_path: Path) -> str | None:
+    """Read SKILL.md from a skill directory, or None if it does not exist."""
+    try:
+        raw = (skill_path / "SKILL.md").read_bytes()
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    # One bulk decode instead of read_text's incremental text layer
+    content = raw.decode("utf-8")
+    if "\r" in content:
+        # Same universal-newline handling read_text applies
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
+
+
+def evaluate_skill(
+    skill_path: Path,
+    verbose: bool = False,
+    evaluated_at: Optional[str] = None,
+) -> EvaluationReport:
+    """Run Quick Eval on a skill and return report. evaluated_at defaults to now."""
     skill_path = Path(skill_path).resolve()
-    
+    return _evaluate_skill_from_content(skill_path, _read_skill_md(skill_path), verbose, evaluated_at)
+
+
+def _evaluate_skill_from_content(
+    skill_path: Path,
+    content: str | None,
+    verbose: bool = False,
+    evaluated_at: Optional[str] = None,
+) -> EvaluationReport:
+    """Run Quick Eval on already-read SKILL.md content (None if missing)."""
     # Initialize report
     report = EvaluationReport(
         skill_id=skill_path.name,
         skill_path=str(skill_path),
-        evaluated_at=datetime.utcnow().isoformat() + "Z",
+        evaluated_at=evaluated_at or _utc_timestamp(),
     )
 
-    # Read SKILL.md
-    skill_md = skill_path / "SKILL.md"
-    if not skill_md.exists():
+    if content is None:
         report.issues.append(Issue("error", "NO_SKILL_MD", f"SKILL.md not found in {skill_path}"))
         report.badge = "fail"
         report.is_passed = False
         report.badge_markdown, report.badge_html = generate_badge_markdown("fail", report.skill_id)
         return report
 
-    content = skill_md.read_text(encoding="utf-8")
+    # One directory listing serves the structure and tool-reference checks
+    with os.scandir(skill_path) as it:
+        dir_entries = {entry.name: entry for entry in it}
+
     frontmatter, body, parse_issues = parse_frontmatter(content)
     report.issues.extend(parse_issues)
 
@@ -609,11 +775,13 @@ def evaluate_skill(skill_path: Path, verbose: bool = False) -> EvaluationReport:
     check_token_efficiency(frontmatter, body, report.token_warnings)
 
     # Run checks
-    report.scores.structure = check_structure(skill_path, frontmatter, body, report.issues)
-    report.scores.triggers = check_triggers(frontmatter, body, report.issues)
-    report.scores.actionability = check_actionability(body, report.issues)
-    report.scores.tool_refs = check_tool_refs(skill_path, body, report.issues)
-    report.scores.examples = check_examples(body, report.issues)
+    body_lower = body.lower()
+    presence = _scan_presence(body)
+    report.scores.structure = check_structure(dir_entries, frontmatter, body, report.issues)
+    report.scores.triggers = check_triggers(frontmatter, presence, report.issues)
+    report.scores.actionability = check_actionability(body_lower, presence, report.issues)
+    report.scores.tool_refs = check_tool_refs(skill_path, dir_entries, body, body_lower, presence, report.issues)
+    report.scores.examples = check_examples(body, presence, report.issues)
 
     # Determine badge
     overall = report.scores.overall
@@ -654,13 +822,25 @@ def evaluate_skill(skill_path: Path, verbose: bool = False) -> EvaluationReport:
 
 
 def evaluate_batch(skills_dir: Path, verbose: bool = False) -> list[EvaluationReport]:
-    """Evaluate all skills in a directory."""
-    reports = []
-    for skill_path in skills_dir.iterdir():
-        if skill_path.is_dir() and (skill_path / "SKILL.md").exists():
-            report = evaluate_skill(skill_path, verbose)
-            reports.append(report)
-    return reports
+    """Evaluate all skills in a directory (in parallel for large directories)."""
+    # Resolve once; entries of a resolved directory are already absolute
+    skills_dir = Path(skills_dir).resolve()
+    skill_paths = [p for p in skills_dir.iterdir() if p.is_dir() and (p / "SKILL.md").exists()]
+
+    # All reports in a batch share one timestamp
+    evaluated_at = _utc_timestamp()
+
+    # Overlap the small-file reads up front; open() releases the GIL
+    with ThreadPoolExecutor() as executor:
+        contents = list(executor.map(_read_skill_md, skill_paths))
+
+    if len(skill_paths) < BATCH_PARALLEL_MIN:
+        return [_evaluate_skill_from_content(p, c, verbose, evaluated_at) for p, c in zip(skill_paths, contents)]
+
+    chunksize = max(1, len(skill_paths) // ((os.cpu_count() or 1) * 4))
+    with ProcessPoolExecutor() as executor:
+        return list(executor.map(_evaluate_skill_from_content, skill_paths, contents,
+                                 repeat(verbose), repeat(evaluated_at), chunksize=chunksize))
 
 
 # =============================================================================
@@ -692,21 +872,22 @@ Examples:
         print(f"Error: Path not found: {path}", file=sys.stderr)
         sys.exit(1)
 
-    # Import visualize for HTML output
-    try:
-        from visualize import generate_html_report
-    except ImportError:
-        # Fallback for when run as module
-        import importlib.util
-        spec = importlib.util.spec_from_file_location("visualize", Path(__file__).parent / "visualize.py")
-        visualize = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(visualize)
-        generate_html_report = visualize.generate_html_report
+    # Import visualize only for HTML output
+    if args.format == "html":
+        try:
+            from visualize import generate_html_report
+        except ImportError:
+            # Fallback for when run as module
+            import importlib.util
+            spec = importlib.util.spec_from_file_location("visualize", Path(__file__).parent / "visualize.py")
+            visualize = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(visualize)
+            generate_html_report = visualize.generate_html_report
 
     if args.batch:
         reports = evaluate_batch(path, args.verbose)
         if args.format == "json":
-            output = json.dumps([r.to_dict() for r in reports], indent=2, ensure_ascii=False)
+            output = _dumps([r.to_dict() for r in reports])
         elif args.format == "html":
             # For batch, generate combined HTML or multiple files
             output = "\n<!-- BATCH SEPARATOR -->\n".join(
@@ -12,9 +12,38 @@ Usage:
 
 import argparse
 import json
+import string
 import sys
 from pathlib import Path
-from typing import Union
+from typing import Any, Iterator, TextIO, Union
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads  # also accepts UTF-8 bytes
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+# Same replacements as html.escape(quote=True), applied in one C-level pass;
+# values go through str() first since report JSON may hold null/numbers
+_HTML_ESCAPE = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;",
+    "'": "&#x27;",
+})
+
+_BADGE_EMOJI = {"gold": "🥇", "silver": "🥈", "bronze": "🥉", "fail": "❌"}
+_BADGE_TEXT = {"gold": "GOLD", "silver": "SILVER", "bronze": "BRONZE", "fail": "NEEDS WORK"}
+_SEVERITY_ICON = {"error": "🔴", "warning": "🟡", "info": "🔵"}
+
+# Bound once so score labels skip building a new f-string per field
+_fmt2 = "{:.2f}".format
 
 
 # Elegant Light Theme matching Anything Skills frontend
@@ -337,93 +366,240 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
 </html>'''
 
 
+def _compile_template(template: str) -> tuple[list[str], list[str]]:
+    """
+    Split a str.format template into literal chunks and field names.
+
+    Returns (literals, fields) with len(literals) == len(fields) + 1; escaped
+    {{ }} braces are already unescaped in the literals, so rendering is just
+    interleaving literals with field values.
+    """
+    literals, fields = [], []
+    chunk = []
+    for literal, field_name, _, _ in string.Formatter().parse(template):
+        chunk.append(literal)
+        if field_name is not None:
+            literals.append("".join(chunk))
+            fields.append(field_name)
+            chunk = []
+    literals.append("".join(chunk))
+    return literals, fields
+
+
+# Parsed once at import instead of re-scanning every CSS brace per report
+_LITERALS, _FIELDS = _compile_template(HTML_TEMPLATE)
+# Static CSS/HTML encoded once; only substituted values are encoded per render
+_LITERALS_B = [literal.encode("utf-8") for literal in _LITERALS]
+
+# Order of the tuple returned by _template_values
+_VALUE_ORDER = (
+    "skill_id", "overall_score", "badge", "badge_emoji", "badge_upper",
+    "structure_score", "triggers_score", "actionability_score",
+    "tool_refs_score", "examples_score",
+    "structure_raw", "triggers_raw", "actionability_raw", "tool_refs_raw", "examples_raw",
+    "issues_section", "recommendations_section", "evaluated_at", "tier",
+)
+# Position of each template field's value; a field missing from _VALUE_ORDER fails at import
+_FIELD_INDEX = [_VALUE_ORDER.index(field_name) for field_name in _FIELDS]
+
+
 def generate_html_report(report: dict) -> str:
     """Generate HTML report from evaluation data."""
+    return "".join(iter_html_report(report))
+
+
+def generate_html_report_stream(report: dict, fp: TextIO) -> None:
+    """Write HTML report to an open text file piece by piece."""
+    fp.writelines(iter_html_report(report))
+
+
+def iter_html_report(report: dict) -> Iterator[str]:
+    """
+    Yield the HTML report as consecutive string chunks.
+
+    Values are computed before this returns, so bad report data raises
+    here, before a caller has opened (and truncated) its output file.
+    """
+    return _chunks(_template_values(report))
+
+
+def iter_html_report_bytes(report: dict) -> Iterator[bytes]:
+    """Yield the HTML report as UTF-8 encoded chunks for binary writes (values computed eagerly)."""
+    return _chunks_bytes(_template_values(report))
+
+
+def _chunks(values: tuple) -> Iterator[str]:
+    yield _LITERALS[0]
+    for index, literal in zip(_FIELD_INDEX, _LITERALS[1:]):
+        value = values[index]
+        if isinstance(value, list):
+            yield from value  # Pre-chunked section, no intermediate join
+        else:
+            yield str(value)
+        yield literal
+
+
+def _chunks_bytes(values: tuple) -> Iterator[bytes]:
+    yield _LITERALS_B[0]
+    for index, literal in zip(_FIELD_INDEX, _LITERALS_B[1:]):
+        value = values[index]
+        if isinstance(value, list):
+            yield "".join(value).encode("utf-8")
+        else:
+            yield str(value).encode("utf-8")
+        yield literal
+
+
+def _template_values(report: dict) -> tuple:
+    """Substitution values for HTML_TEMPLATE, in _VALUE_ORDER."""
     scores = report.get("scores", {})
-    issues = report.get("issues", [])
-    recommendations = report.get("recommendations", [])
-    badge = report.get("badge", "fail")
-    
-    badge_emoji = {"gold": "🥇", "silver": "🥈", "bronze": "🥉", "fail": "❌"}.get(badge, "")
+    # One lookup per score, reused for both the label and the radar value
+    return _assemble_values(
+        report.get("skill_id", "Unknown"),
+        report.get("badge", "fail"),
+        scores.get("overall", 0),
+        scores.get("structure", 0),
+        scores.get("triggers", 0),
+        scores.get("actionability", 0),
+        scores.get("tool_refs", 0),
+        scores.get("examples", 0),
+        report.get("issues", []),
+        report.get("recommendations", []),
+        report.get("evaluated_at", ""),
+        report.get("tier", "quick"),
+    )
+
+
+def _struct_template_values(report: "_Report") -> tuple:
+    """_template_values for a report decoded with msgspec."""
+    scores = report.scores
+    return _assemble_values(
+        "Unknown" if report.skill_id is msgspec.UNSET else report.skill_id,
+        report.badge,
+        scores.overall,
+        scores.structure,
+        scores.triggers,
+        scores.actionability,
+        scores.tool_refs,
+        scores.examples,
+        report.issues,
+        report.recommendations,
+        report.evaluated_at,
+        report.tier,
+    )
+
+
+def _assemble_values(
+    skill_id, badge, s_over, s_struct, s_trig, s_act, s_tool, s_ex,
+    issues: list, recommendations: list, evaluated_at, tier,
+) -> tuple:
+    badge_emoji = _BADGE_EMOJI.get(badge, "")
     
-    # Issues section
-    issues_html = ""
-    if issues:
-        items = []
-        for issue in issues:
-            severity = issue.get("severity", "info")
-            icon = {"error": "🔴", "warning": "🟡", "info": "🔵"}.get(severity, "")
-            suggestion = ""
-            if issue.get("suggestion"):
-                suggestion = f'<div class="issue-suggestion">💡 {issue["suggestion"]}</div>'
-            items.append(f'''
-                <li class="issue-item issue-{severity}">
-                    <span class="issue-icon">{icon}</span>
+    return (
+        str(skill_id).translate(_HTML_ESCAPE),
+        _fmt2(s_over),
+        str(badge).translate(_HTML_ESCAPE),
+        badge_emoji,
+        str(badge).upper().translate(_HTML_ESCAPE),  # upper() first, entities stay lowercase
+        _fmt2(s_struct),
+        _fmt2(s_trig),
+        _fmt2(s_act),
+        _fmt2(s_tool),
+        _fmt2(s_ex),
+        s_struct,
+        s_trig,
+        s_act,
+        s_tool,
+        s_ex,
+        _issue_chunks(issues),
+        _recommendation_chunks(recommendations),
+        str(evaluated_at).translate(_HTML_ESCAPE),
+        str(tier).translate(_HTML_ESCAPE),
+    )
+
+
+def _issue_chunks(issues: list) -> list[str]:
+    """Issues card as a flat list of HTML chunks (empty if no issues)."""
+    if not issues:
+        return []
+    chunks = [f'''
+        <div class="card">
+            <div class="card-title">⚠️ Issues ({len(issues)})</div>
+            <ul class="issues-list">''']
+    append = chunks.append
+    for issue in issues:
+        severity = issue.get("severity", "info")
+        append('''
+                <li class="issue-item issue-''')
+        append(str(severity).translate(_HTML_ESCAPE))
+        append('''">
+                    <span class="issue-icon">''')
+        append(_SEVERITY_ICON.get(severity, ""))
+        append('''</span>
                     <div class="issue-content">
-                        <div>{issue.get("message", "")}</div>
-                        <div class="issue-code">{issue.get("code", "")}</div>
-                        {suggestion}
+                        <div>''')
+        append(str(issue.get("message", "")).translate(_HTML_ESCAPE))
+        append('''</div>
+                        <div class="issue-code">''')
+        append(str(issue.get("code", "")).translate(_HTML_ESCAPE))
+        append('''</div>
+                        ''')
+        suggestion = issue.get("suggestion")
+        if suggestion:
+            append('<div class="issue-suggestion">💡 ')
+            append(str(suggestion).translate(_HTML_ESCAPE))
+            append('</div>')
+        append('''
                     </div>
                 </li>
             ''')
-        issues_html = f'''
-        <div class="card">
-            <div class="card-title">⚠️ Issues ({len(issues)})</div>
-            <ul class="issues-list">{"".join(items)}</ul>
+    append('''</ul>
         </div>
-        '''
-    
-    # Recommendations section
-    rec_html = ""
-    if recommendations:
-        items = [f"<li>{rec}</li>" for rec in recommendations]
-        rec_html = f'''
+        ''')
+    return chunks
+
+
+def _recommendation_chunks(recommendations: list) -> list[str]:
+    """Recommendations card as a flat list of HTML chunks (empty if none)."""
+    if not recommendations:
+        return []
+    chunks = ['''
         <div class="card">
             <div class="card-title">💡 Recommendations</div>
-            <ol class="recommendations">{"".join(items)}</ol>
+            <ol class="recommendations">''']
+    append = chunks.append
+    for rec in recommendations:
+        append("<li>")
+        append(str(rec).translate(_HTML_ESCAPE))
+        append("</li>")
+    append('''</ol>
         </div>
-        '''
-    
-    return HTML_TEMPLATE.format(
-        skill_id=report.get("skill_id", "Unknown"),
-        overall_score=f"{scores.get('overall', 0):.2f}",
-        badge=badge,
-        badge_emoji=badge_emoji,
-        badge_upper=badge.upper(),
-        structure_score=f"{scores.get('structure', 0):.2f}",
-        triggers_score=f"{scores.get('triggers', 0):.2f}",
-        actionability_score=f"{scores.get('actionability', 0):.2f}",
-        tool_refs_score=f"{scores.get('tool_refs', 0):.2f}",
-        examples_score=f"{scores.get('examples', 0):.2f}",
-        structure_raw=scores.get('structure', 0),
-        triggers_raw=scores.get('triggers', 0),
-        actionability_raw=scores.get('actionability', 0),
-        tool_refs_raw=scores.get('tool_refs', 0),
-        examples_raw=scores.get('examples', 0),
-        issues_section=issues_html,
-        recommendations_section=rec_html,
-        evaluated_at=report.get("evaluated_at", ""),
-        tier=report.get("tier", "quick"),
-    )
+        ''')
+    return chunks
+
 
+def generate_modal_html(report: dict, *, render_html: bool = True) -> dict:
+    """
+    Generate inline modal HTML for embedding in frontend.
 
-def generate_modal_html(report: dict) -> str:
-    """Generate inline modal HTML for embedding in frontend."""
+    Pass render_html=False when only the badge/score fields are needed;
+    issues_html is then left empty and no issue markup is built.
+    """
     scores = report.get("scores", {})
     issues = report.get("issues", [])
     badge = report.get("badge", "fail")
     
-    badge_emoji = {"gold": "🥇", "silver": "🥈", "bronze": "🥉", "fail": "❌"}.get(badge, "")
-    badge_text = {"gold": "GOLD", "silver": "SILVER", "bronze": "BRONZE", "fail": "NEEDS WORK"}.get(badge, "")
+    badge_emoji = _BADGE_EMOJI.get(badge, "")
+    badge_text = _BADGE_TEXT.get(badge, "")
     
     # Issues summary
     issues_html = ""
-    if issues:
+    if render_html and issues:
         items = []
         for issue in issues[:5]:  # Limit to 5 issues in modal
             severity = issue.get("severity", "info")
-            icon = {"error": "🔴", "warning": "🟡", "info": "🔵"}.get(severity, "")
-            items.append(f'<div class="eval-issue">{icon} {issue.get("message", "")}</div>')
+            icon = _SEVERITY_ICON.get(severity, "")
+            items.append(f'<div class="eval-issue">{icon} {str(issue.get("message", "")).translate(_HTML_ESCAPE)}</div>')
         issues_html = "".join(items)
         if len(issues) > 5:
             issues_html += f'<div class="eval-issue-more">+{len(issues) - 5} more issues</div>'
@@ -445,28 +621,62 @@ def generate_modal_html(report: dict) -> str:
     }
 
 
+if msgspec is not None:
+    class _Scores(msgspec.Struct):
+        overall: Union[int, float] = 0
+        structure: Union[int, float] = 0
+        triggers: Union[int, float] = 0
+        actionability: Union[int, float] = 0
+        tool_refs: Union[int, float] = 0
+        examples: Union[int, float] = 0
+
+    # Same defaults as the .get() calls in _template_values; text fields stay
+    # Any since they are str()-ed on render, issues stay dicts for _issue_chunks
+    class _Report(msgspec.Struct):
+        skill_id: Any = msgspec.UNSET
+        badge: Any = "fail"
+        scores: _Scores = msgspec.field(default_factory=_Scores)
+        issues: list[dict] = []
+        recommendations: list = []
+        evaluated_at: Any = ""
+        tier: Any = "quick"
+
+
 def main():
     parser = argparse.ArgumentParser(description="Generate visual HTML report from evaluation JSON")
     parser.add_argument("input", help="Path to evaluation_report.json or - for stdin")
     parser.add_argument("--output", "-o", help="Output HTML file path")
     args = parser.parse_args()
     
+    # Parse raw bytes directly; skips the separate UTF-8 decode pass
     if args.input == "-":
-        data = json.load(sys.stdin)
+        raw = sys.stdin.buffer.read()
     else:
-        data = json.loads(Path(args.input).read_text(encoding="utf-8"))
+        raw = Path(args.input).read_bytes()
     
-    html = generate_html_report(data)
+    # With msgspec, decode straight into typed structs (slot reads instead of
+    # dict lookups, and malformed fields fail at decode time)
+    if msgspec is not None:
+        report = msgspec.json.decode(raw, type=_Report)
+        skill_id = "skill" if report.skill_id is msgspec.UNSET else report.skill_id
+        values = _struct_template_values(report)
+    else:
+        data = _loads(raw)
+        skill_id = data.get("skill_id", "skill")
+        values = _template_values(data)
     
     if args.output:
-        Path(args.output).write_text(html, encoding="utf-8")
-        print(f"Report saved to: {args.output}")
+        output_path = args.output
     else:
         # Default output path
-        skill_id = data.get("skill_id", "skill")
         output_path = f"{skill_id}_report.html"
-        Path(output_path).write_text(html, encoding="utf-8")
-        print(f"Report saved to: {output_path}")
+
+    # Render values before opening, so invalid data leaves an existing report intact;
+    # then stream chunks to disk instead of building the whole page in memory
+    chunks = _chunks_bytes(values)
+    with open(output_path, "wb", buffering=1 << 16) as f:
+        f.writelines(chunks)
+    print(f"Report saved to: {output_path}")
 
 
 if __name__ == "__main__":
@@ -3,19 +3,110 @@
 Download skill from GitHub and convert to opencode format
 
 Fetches skill from GitHub and creates a proper SKILL.md
+
+Usage:
+    python3 download_skill.py <skill_id> <output_dir> [--install]
+
+Pass --install to also run `npx skills add <skill_id>` after downloading;
+without it only SKILL.md is written and no node process is spawned.
 """
 
+import hashlib
 import logging
-import requests
+import os
+import tempfile
+import urllib.error
+import urllib.request
 import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 import subprocess
-import sys
-from typing import Dict
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+_json_loads = orjson.loads if orjson is not None else json.loads
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# One-shot CLI runs go through urllib and never pay for importing requests;
+# library callers (download_many, skills-sh-searcher) keep the pooled session
+USE_URLLIB = False
+
+
+@lru_cache(maxsize=None)
+def _get_session():
+    """Shared session: keeps TCP/TLS connections to api.github.com alive across calls"""
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            raise_on_status=False,  # Hand the final response back so its status gets logged
+        ),
+    ))
+    return session
+
+
+def _http_get(url: str, headers: Dict[str, str]) -> Tuple[int, object, bytes]:
+    """GET url, returning (status, headers, body); headers support case-insensitive .get()"""
+    if not USE_URLLIB:
+        response = _get_session().get(url, timeout=(3.05, 30), headers=headers)
+        return response.status_code, response.headers, response.content
+    request = urllib.request.Request(url, headers=headers)
+    try:
+        with urllib.request.urlopen(request, timeout=30) as response:
+            return response.status, response.headers, response.read()
+    except urllib.error.HTTPError as e:
+        # Non-2xx (including 304 Not Modified) arrives as an exception
+        return e.code, e.headers, e.read()
+
+GITHUB_HEADERS = {
+    'Accept': 'application/vnd.github+json',
+    'User-Agent': 'skills-evaluator',
+}
+
+# Repo info cached per skill_id with its ETag; revalidated via If-None-Match
+GITHUB_CACHE_DIR = Path.home() / '.cache' / 'skills-evaluator' / 'github'
+
+
+def _repo_cache_path(skill_id: str) -> Path:
+    return GITHUB_CACHE_DIR / f"{hashlib.sha1(skill_id.encode('utf-8')).hexdigest()}.json"
+
+
+def _load_cached_repo(cache_path: Path) -> Optional[Dict]:
+    """Return cached {'etag', 'repo_info'} or None if missing/unreadable"""
+    try:
+        cached = json.loads(cache_path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or not cached.get('etag') or 'repo_info' not in cached:
+        return None
+    return cached
+
+
+def _save_cached_repo(cache_path: Path, etag: str, repo_info: Dict) -> None:
+    """Atomically write the cache entry (temp file + os.replace)"""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump({'etag': etag, 'repo_info': repo_info}, f)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.warning(f"Could not cache GitHub response: {e}")
+
 
 def download_skill_from_github(skill_id: str, output_dir: str) -> Dict:
     """
@@ -32,14 +123,28 @@ def download_skill_from_github(skill_id: str, output_dir: str) -> Dict:
 
     try:
         # Convert skill_id to GitHub URL
-        github_url = f"https://github.com/{skill_id.replace('/', '/')}"
+        github_url = f"https://github.com/{skill_id}"
         
         # Try to get repo info using GitHub API
         api_url = f"https://api.github.com/repos/{skill_id}"
-        response = requests.get(api_url, timeout=30)
+        cache_path = _repo_cache_path(skill_id)
+        cached = _load_cached_repo(cache_path)
+        headers = GITHUB_HEADERS
+        if cached:
+            headers = {**GITHUB_HEADERS, 'If-None-Match': cached['etag']}
+        status, response_headers, body = _http_get(api_url, headers)
         
-        if response.status_code == 200:
-            repo_info = response.json()
+        repo_info = None
+        if status == 304 and cached:
+            # Unchanged since last download; 304s don't count against the rate limit
+            repo_info = cached['repo_info']
+        elif status == 200:
+            repo_info = _json_loads(body)
+            etag = response_headers.get('ETag')
+            if etag:
+                _save_cached_repo(cache_path, etag, repo_info)
+        
+        if repo_info is not None:
             description = repo_info.get('description', '')
             
             # Create skill directory
@@ -91,8 +196,17 @@ npx skills add {skill_id}
 This skill was automatically downloaded and converted by the Skills Learning Agent.
 """
             
-            with open(skill_md_path, 'w', encoding='utf-8') as f:
-                f.write(skill_md_content)
+            # Write to a sibling temp file and rename, so an interrupted run
+            # never leaves a truncated SKILL.md behind; the name is unique so
+            # concurrent downloads of the same skill don't share a temp file
+            fd, tmp_path = tempfile.mkstemp(dir=skill_dir, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    f.write(skill_md_content)
+                os.replace(tmp_path, skill_md_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
             
             logger.info(f"Successfully downloaded skill to: {skill_dir}")
             
@@ -104,10 +218,10 @@ This skill was automatically downloaded and converted by the Skills Learning Age
             }
         
         else:
-            logger.error(f"GitHub API returned status {response.status_code}")
+            logger.error(f"GitHub API returned status {status}")
             return {
                 'success': False,
-                'error': f"GitHub API error: {response.status_code}"
+                'error': f"GitHub API error: {status}"
             }
 
     except Exception as e:
@@ -118,6 +232,22 @@ This skill was automatically downloaded and converted by the Skills Learning Age
         }
 
 
+def download_many(skill_ids: List[str], output_dir: str, max_workers: int = 8) -> List[Dict]:
+    """
+    Download several skills concurrently
+
+    Args:
+        skill_ids: GitHub owner/repo/skill_name IDs
+        output_dir: Output directory
+        max_workers: Maximum concurrent downloads (keep <= session pool size)
+
+    Returns:
+        Downloaded skill info per ID, in input order
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(lambda skill_id: download_skill_from_github(skill_id, output_dir), skill_ids))
+
+
 def install_skill(skill_dir: str) -> bool:
     """
     Install skill using npx skills add command
@@ -141,17 +271,26 @@ def install_skill(skill_dir: str) -> bool:
             logger.error(f"SKILL.md not found: {skill_md}")
             return False
         
+        # Extract github_url from the frontmatter to find skill_id; stops at the
+        # closing --- so the body is never read
+        github_url = None
         with open(skill_md, 'r', encoding='utf-8') as f:
-            content = f.read()
+            for line_num, line in enumerate(f):
+                line = line.strip()
+                if line == '---':
+                    if line_num > 0:
+                        break
+                    continue
+                if line.startswith('github_url:'):
+                    value = line.split(':', 1)[1].strip()
+                    if value.startswith('https://github.com/'):
+                        github_url = value.split()[0]
+                    break
         
-        # Extract github_url to find skill_id
-        import re
-        url_match = re.search(r'github_url:\s*(https://github\.com/[^\s]+)', content)
-        if not url_match:
+        if not github_url:
             logger.error("Could not find github_url in SKILL.md")
             return False
         
-        github_url = url_match.group(1)
         skill_id = github_url.replace('https://github.com/', '')
         
         # Install using npx skills add
@@ -179,21 +318,24 @@ def install_skill(skill_dir: str) -> bool:
 
 
 if __name__ == "__main__":
-    if len(sys.argv) < 3:
-        print("Usage: python3 download_skill.py <skill_id> <output_dir>")
-        print("Example: python3 download_skill.py anthropics/skills/pdf /Users/user/.opencode/skill/")
-        sys.exit(1)
-    
-    skill_id = sys.argv[1]
-    output_dir = sys.argv[2]
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description='Download a skill from GitHub and write its SKILL.md',
+        epilog='Example: python3 download_skill.py anthropics/skills/pdf /Users/user/.opencode/skill/ --install'
+    )
+    parser.add_argument('skill_id', help='Skill ID (owner/repo/skill)')
+    parser.add_argument('output_dir', help='Directory to download the skill into')
+    parser.add_argument('--install', action='store_true', help='Also install via npx skills add')
+    args = parser.parse_args()
+    USE_URLLIB = True
     
-    result = download_skill_from_github(skill_id, output_dir)
+    result = download_skill_from_github(args.skill_id, args.output_dir)
     
-    if result.get('success'):
-        # Optionally install
+    if result.get('success') and args.install:
         skill_dir = result.get('skill_dir', '')
         if install_skill(skill_dir):
             print("\nSkill installed successfully!")
         else:
             print("\nSkill downloaded but installation failed. You can manually install with:")
-            print(f"  npx skills add {skill_id}")
+            print(f"  npx skills add {args.skill_id}")
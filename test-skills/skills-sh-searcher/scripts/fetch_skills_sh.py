@@ -5,16 +5,112 @@ Fetch skills from skills.sh leaderboard
 Parse skills.sh homepage and extract skill information
 """
 
+import heapq
 import logging
 import requests
-from bs4 import BeautifulSoup
-from typing import List, Dict
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
+from operator import attrgetter, itemgetter
+from types import MappingProxyType
+from typing import Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
 import re
 import json
 
+try:
+    import ahocorasick  # pyahocorasick: one scan per field for any number of keywords
+except ImportError:
+    ahocorasick = None
+
+try:
+    from lxml import etree  # C-backed parser, much faster than html.parser
+    _HTML_PARSER = 'lxml'
+except ImportError:
+    etree = None
+    _HTML_PARSER = 'html.parser'
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Shared session: keeps the skills.sh connection alive across leaderboard/detail fetches
+_SESSION = requests.Session()
+_SESSION.headers['User-Agent'] = 'skills-evaluator'
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        raise_on_status=False,  # Let raise_for_status report the final response
+    ),
+))
+
+# Leaderboard parsing only needs links; everything else is dropped during the parse
+_LINKS_ONLY = SoupStrainer('a', href=True)
+
+# The suffix must not start a word: "3 months" and "1mcp-builder" are not millions
+_INSTALL_RE = re.compile(r'(\d[\d,]*(?:\.\d+)?)\s*([KkMm](?![A-Za-z]))?')
+# Thousands separators only; '.' is a decimal point ("1.2K")
+_STRIP_PUNCT = str.maketrans('', '', ',')
+_INSTALL_MULTIPLIERS = {'K': 1000, 'k': 1000, 'M': 1_000_000, 'm': 1_000_000}
+_DESC_CLASS_RE = re.compile(r'description|summary', re.I)
+_TAG_CLASS_RE = re.compile(r'tag|badge|category', re.I)
+# Elements that carry a skill page's install count
+_INSTALL_SELECTOR = '[class*="install"], [class*="count"], header, .stats'
+
+
+# Internal record; the public functions hand out plain dicts (asdict)
+@dataclass(slots=True)
+class Skill:
+    skill_id: str  # owner/repo/skill_name
+    skill_name: str
+    installs: int
+    skill_url: str
+    text_snippet: str = ''
+    description: str = ''
+    tags: List[str] = field(default_factory=list)
+    relevance_score: int = 0
+
+
+def _parse_installs(text: str) -> int:
+    """Parse the first install count in text ("1.2K" -> 1200, "12,345" -> 12345); 0 if none"""
+    install_match = _INSTALL_RE.search(text)
+    if not install_match:
+        return 0
+    number, suffix = install_match.groups()
+    return int(float(number.translate(_STRIP_PUNCT)) * _INSTALL_MULTIPLIERS.get(suffix, 1))
+
+
+def _iter_links(response: requests.Response) -> Iterator[Tuple[str, str]]:
+    """Yield (href, text) for each site-relative link on the page"""
+    if etree is None:
+        soup = BeautifulSoup(response.text, _HTML_PARSER, parse_only=_LINKS_ONLY)
+        for a in soup.select('a[href^="/"]'):
+            yield a['href'], a.get_text(strip=True)
+        return
+
+    # Parse incrementally while the body is still downloading; only <a>
+    # elements are reported and each is cleared once read
+    parser = etree.HTMLPullParser(events=('end',), tag='a', encoding=response.encoding or 'utf-8')
+
+    def drain() -> Iterator[Tuple[str, str]]:
+        for _, elem in parser.read_events():
+            href = elem.get('href')
+            if href and href.startswith('/'):
+                yield href, ''.join(text.strip() for text in elem.itertext())
+            elem.clear()
+
+    for chunk in response.iter_content(chunk_size=8192):
+        parser.feed(chunk)
+        yield from drain()
+    parser.close()
+    yield from drain()
+
 
 def fetch_skills_sh_leaderboard(limit: int = 50) -> List[Dict]:
     """
@@ -26,6 +122,10 @@ def fetch_skills_sh_leaderboard(limit: int = 50) -> List[Dict]:
     Returns:
         List of skills with metadata
     """
+    return [asdict(skill) for skill in _fetch_leaderboard(limit)]
+
+
+def _fetch_leaderboard(limit: int) -> List[Skill]:
     logger.info(f"Fetching top {limit} skills from skills.sh...")
 
     skills = []
@@ -33,67 +133,47 @@ def fetch_skills_sh_leaderboard(limit: int = 50) -> List[Dict]:
     try:
         # Fetch skills.sh homepage
         url = "https://skills.sh"
-        response = requests.get(url, timeout=30)
-        response.raise_for_status()
-
-        soup = BeautifulSoup(response.text, 'html.parser')
-
-        # Skills.sh shows skills in a table/list format
-        # Try to find skill links and information
-        # Look for links in format /owner/repo/skill_name
-
-        skill_links = []
-
-        # Find all links that match skill pattern
-        for a in soup.find_all('a', href=True):
-            href = a.get('href', '')
-            
-            # Match pattern: /owner/repo/skill_name
-            if href and href.startswith('/') and href.count('/') >= 3:
-                parts = href.strip('/').split('/')
-                if len(parts) >= 3:
-                    skill_id = '/'.join(parts[:3])  # owner/repo/skill_name
-                    
-                    # Get skill name and install count from the link content
-                    # Skills.sh shows installs and name in the link
-                    text = a.get_text(strip=True)
-                    
-                    # Try to extract install count from text
-                    install_match = re.search(r'(\d+(?:\.\d+)?[Kk]?)', text)
-                    installs = 0
-                    if install_match:
-                        install_str = install_match.group(1).replace(',', '').replace('.', '')
-                        installs = int(install_str)
-                        # Handle K (thousands)
-                        if 'K' in install_match.group(0):
-                            installs *= 1000
-                        elif 'k' in install_match.group(0):
-                            installs *= 1000
-                    
-                    # Extract skill name
-                    skill_name = skill_id.split('/')[-1]
-                    
-                    skill_links.append({
-                        'skill_id': skill_id,
-                        'skill_name': skill_name,
-                        'installs': installs,
-                        'skill_url': f"https://skills.sh{href}",
-                        'full_url': f"https://skills.sh{href}",
-                        'text_snippet': text
-                    })
-
-        # Remove duplicates and sort by installs
-        seen = {}
-        unique_skills = []
-        for skill in skill_links:
-            if skill['skill_id'] not in seen:
-                seen[skill['skill_id']] = True
-                unique_skills.append(skill)
-        
-        # Sort by installs
-        unique_skills.sort(key=lambda x: x.get('installs', 0), reverse=True)
+        with _SESSION.get(url, timeout=30, stream=True) as response:
+            response.raise_for_status()
+
+            # Skills.sh shows skills in a table/list format
+            # Try to find skill links and information
+            # Look for links in format /owner/repo/skill_name
+
+            skill_links = []
+
+            # Find all site-relative links that match skill pattern
+            # Skills.sh shows installs and name in the link text
+            for href, text in _iter_links(response):
+                # Match pattern: /owner/repo/skill_name
+                if href.count('/') >= 3:
+                    parts = href.strip('/').split('/')
+                    if len(parts) >= 3:
+                        skill_id = '/'.join(parts[:3])  # owner/repo/skill_name
+                        
+                        # Try to extract install count from text
+                        installs = _parse_installs(text)
+                        
+                        # Extract skill name
+                        skill_name = skill_id.split('/')[-1]
+                        
+                        skill_links.append(Skill(
+                            skill_id=skill_id,
+                            skill_name=skill_name,
+                            installs=installs,
+                            skill_url=f"https://skills.sh{href}",
+                            text_snippet=text
+                        ))
+
+        # Remove duplicates (first occurrence wins)
+        seen = set()
+        unique_skills = [
+            skill for skill in skill_links
+            if not (skill.skill_id in seen or seen.add(skill.skill_id))
+        ]
         
-        skills = unique_skills[:limit]
+        # Top `limit` by installs without sorting the whole list
+        skills = heapq.nlargest(limit, unique_skills, key=attrgetter('installs'))
         logger.info(f"Fetched {len(skills)} unique skills")
 
     except Exception as e:
@@ -102,139 +182,225 @@ def fetch_skills_sh_leaderboard(limit: int = 50) -> List[Dict]:
     return skills
 
 
-def get_skill_details(skill_id: str) -> Dict:
+def get_skill_details(skill_id: str) -> Optional[Mapping]:
     """
     Fetch detailed information about a specific skill
 
+    Results are cached per process; the returned mapping is read-only
+    (copy with dict() before modifying).
+
     Args:
         skill_id: Skill ID in format owner/repo/skill_name
 
     Returns:
-        Skill details dictionary
+        Skill details mapping, or None if the fetch failed
     """
-    logger.info(f"Fetching details for {skill_id}...")
-
     try:
-        url = f"https://skills.sh/{skill_id}"
-        response = requests.get(url, timeout=30)
-        response.raise_for_status()
-
-        soup = BeautifulSoup(response.text, 'html.parser')
-
-        # Extract skill name
-        title_elem = soup.find('h1') or soup.find('h2')
-        skill_name = title_elem.get_text(strip=True) if title_elem else skill_id.split('/')[-1]
-
-        # Extract description
-        desc_elem = soup.find('p') or soup.find('div', class_=re.compile(r'description|summary', re.I))
-        description = desc_elem.get_text(strip=True) if desc_elem else ''
-
-        # Extract tags
-        tags = []
-        tag_elems = soup.find_all(['span', 'a'], class_=re.compile(r'tag|badge|category', re.I))
-        for tag_elem in tag_elems:
-            tag_text = tag_elem.get_text(strip=True)
-            if tag_text and len(tag_text) < 30:
-                tags.append(tag_text)
-
-        # Get GitHub link if available
-        github_url = f"https://github.com/{skill_id.replace('/', '/')}"
-        skill_url = f"https://skills.sh/{skill_id}"
-
-        # Get install count
-        installs = 0
-        full_text = soup.get_text()
-        install_match = re.search(r'(\d+(?:\.\d+)?[Kk]?)', full_text)
-        if install_match:
-            install_str = install_match.group(1).replace(',', '').replace('.', '')
-            installs = int(install_str) if install_str.isdigit() else 0
-            if 'K' in install_match.group(0):
-                installs *= 1000
-            elif 'k' in install_match.group(0):
-                installs *= 1000
-
-        return {
-            'skill_id': skill_id,
-            'skill_name': skill_name,
-            'description': description,
-            'tags': tags,
-            'installs': installs,
-            'github_url': github_url,
-            'skill_url': skill_url
-        }
-
+        return _fetch_skill_details(skill_id)
     except Exception as e:
         logger.error(f"Failed to fetch details for {skill_id}: {e}")
         return None
 
 
-def filter_by_keywords(skills: List[Dict], keywords: List[str]) -> List[Dict]:
+# Failures raise instead of returning None, so they are never cached
+@lru_cache(maxsize=512)
+def _fetch_skill_details(skill_id: str) -> Mapping:
+    logger.info(f"Fetching details for {skill_id}...")
+
+    url = f"https://skills.sh/{skill_id}"
+    response = _SESSION.get(url, timeout=30)
+    response.raise_for_status()
+
+    soup = BeautifulSoup(response.text, _HTML_PARSER)
+
+    # Extract skill name
+    title_elem = soup.find('h1') or soup.find('h2')
+    skill_name = title_elem.get_text(strip=True) if title_elem else skill_id.split('/')[-1]
+
+    # Extract description
+    desc_elem = soup.find('p') or soup.find('div', class_=_DESC_CLASS_RE)
+    description = desc_elem.get_text(strip=True) if desc_elem else ''
+
+    # Extract tags
+    tags = []
+    tag_elems = soup.find_all(['span', 'a'], class_=_TAG_CLASS_RE)
+    for tag_elem in tag_elems:
+        tag_text = tag_elem.get_text(strip=True)
+        if tag_text and len(tag_text) < 30:
+            tags.append(tag_text)
+
+    # Get GitHub link if available
+    github_url = f"https://github.com/{skill_id}"
+    skill_url = f"https://skills.sh/{skill_id}"
+
+    # Get install count from the nodes that show it; whole-page text only as a fallback
+    install_nodes = soup.select(_INSTALL_SELECTOR)
+    installs = _parse_installs(' '.join(node.get_text() for node in install_nodes))
+    if not installs:
+        installs = _parse_installs(soup.get_text())
+
+    return MappingProxyType({
+        'skill_id': skill_id,
+        'skill_name': skill_name,
+        'description': description,
+        'tags': tuple(tags),
+        'installs': installs,
+        'github_url': github_url,
+        'skill_url': skill_url
+    })
+
+
+def get_skill_details_bulk(skill_ids: List[str], max_workers: int = 8) -> List[Optional[Mapping]]:
+    """
+    Fetch details for several skills concurrently
+
+    Args:
+        skill_ids: Skill IDs in format owner/repo/skill_name
+        max_workers: Maximum concurrent requests (keep <= session pool size)
+
+    Returns:
+        Skill details per ID, in input order (None where the fetch failed)
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(get_skill_details, skill_ids))
+
+
+def _keyword_counter(keywords_lower: List[str]) -> Optional[Callable[[str], int]]:
+    """Return an Aho-Corasick keyword counter for a text, or None without pyahocorasick"""
+    if ahocorasick is None:
+        return None
+
+    # Each keyword counts once per text however often it occurs; repeated
+    # keywords count once per repetition, same as the plain scan
+    always = 0
+    automaton = ahocorasick.Automaton()
+    for kw, count in Counter(keywords_lower).items():
+        if kw:
+            automaton.add_word(kw, (kw, count))
+        else:
+            always = count  # '' is in every string
+    if not len(automaton):
+        return lambda text: always
+    automaton.make_automaton()
+
+    def count_matches(text: str) -> int:
+        found = {value for _, value in automaton.iter(text)}
+        return always + sum(count for _, count in found)
+
+    return count_matches
+
+
+def _keyword_scorer(keywords: List[str]) -> Callable[[str, str, Iterable[str]], int]:
+    """Return a function scoring (name, snippet, tags) against the keywords"""
+    keywords_lower = [kw.lower() for kw in keywords]
+    count_matches = _keyword_counter(keywords_lower)
+
+    def score(skill_name: str, text_snippet: str, tags: Iterable[str]) -> int:
+        # Search in skill name, description snippet and tags
+        skill_name_lower = skill_name.lower()
+        desc_lower = text_snippet.lower()
+        tags_joined = ' '.join(tags).lower()
+        
+        if count_matches is not None:
+            name_matches = count_matches(skill_name_lower)
+            desc_matches = count_matches(desc_lower)
+            tag_matches = count_matches(tags_joined)
+        else:
+            # One pass over the keywords for all three fields
+            name_matches = desc_matches = tag_matches = 0
+            for kw in keywords_lower:
+                name_matches += kw in skill_name_lower
+                desc_matches += kw in desc_lower
+                tag_matches += kw in tags_joined
+        
+        return name_matches * 3 + desc_matches * 2 + tag_matches
+
+    return score
+
+
+def filter_by_keywords(skills: List[Dict], keywords: List[str], limit: Optional[int] = None) -> List[Dict]:
     """
     Filter skills by keywords
 
     Args:
         skills: List of skills
         keywords: List of keywords
+        limit: Return only the top `limit` matches (all if None)
 
     Returns:
-        Filtered list of skills
+        Filtered list of skills with 'relevance_score', most relevant first
     """
     if not keywords:
-        return skills
+        return skills if limit is None else skills[:limit]
 
-    keywords_lower = [kw.lower() for kw in keywords]
+    score = _keyword_scorer(keywords)
     
     filtered_skills = []
     
     for skill in skills:
-        # Search in skill name
-        skill_name_lower = skill['skill_name'].lower()
-        name_matches = sum(1 for kw in keywords_lower if kw in skill_name_lower)
-        
-        # Search in description snippet
-        desc_lower = skill.get('text_snippet', '').lower()
-        desc_matches = sum(1 for kw in keywords_lower if kw in desc_lower)
-        
-        # Search in tags
-        tags_lower = [tag.lower() for tag in skill.get('tags', [])]
-        tag_matches = sum(1 for kw in keywords_lower if kw in ' '.join(tags_lower))
-        
-        total_score = name_matches * 3 + desc_matches * 2 + tag_matches
-        
+        total_score = score(skill['skill_name'], skill.get('text_snippet', ''), skill.get('tags', []))
         if total_score > 0:
             filtered_skills.append({
                 **skill,
                 'relevance_score': total_score
             })
     
-    # Sort by relevance
-    filtered_skills.sort(key=lambda x: x.get('relevance_score', 0), reverse=True)
-    
     logger.info(f"Filtered to {len(filtered_skills)} skills matching keywords")
     
-    return filtered_skills
+    # Most relevant first; with a limit only the top entries are ordered
+    count = len(filtered_skills) if limit is None else limit
+    return heapq.nlargest(count, filtered_skills, key=itemgetter('relevance_score'))
 
 
-def search_skills(keywords: List[str], limit: int = 10) -> List[Dict]:
+def _filter_skills(skills: List[Skill], keywords: List[str], limit: Optional[int]) -> List[Skill]:
+    """filter_by_keywords for internal Skill records; scores are set in place"""
+    if not keywords:
+        return skills if limit is None else skills[:limit]
+
+    score = _keyword_scorer(keywords)
+    
+    matched = []
+    
+    for skill in skills:
+        total_score = score(skill.skill_name, skill.text_snippet, skill.tags)
+        if total_score > 0:
+            skill.relevance_score = total_score
+            matched.append(skill)
+    
+    logger.info(f"Filtered to {len(matched)} skills matching keywords")
+    
+    count = len(matched) if limit is None else limit
+    return heapq.nlargest(count, matched, key=attrgetter('relevance_score'))
+
+
+def search_skills(keywords: List[str], limit: int = 10, with_details: bool = False) -> List[Dict]:
     """
     Search for skills matching keywords
 
     Args:
         keywords: Search keywords
         limit: Maximum number of results
+        with_details: Also fetch each result's skills.sh page for description/tags
 
     Returns:
         List of matching skills
     """
     logger.info(f"Searching skills.sh for: {keywords}")
     
-    # Fetch skills from leaderboard
-    all_skills = fetch_skills_sh_leaderboard(limit=100)
+    # Fetch skills from leaderboard (as Skill records until the return)
+    all_skills = _fetch_leaderboard(limit=100)
     
     # Filter by keywords
-    matching_skills = filter_by_keywords(all_skills, keywords)
+    matching_skills = _filter_skills(all_skills, keywords, limit)
+    
+    if with_details:
+        details = get_skill_details_bulk([skill.skill_id for skill in matching_skills])
+        for skill, detail in zip(matching_skills, details):
+            if detail:
+                skill.description = detail['description']
+                skill.tags = list(detail['tags'])
     
-    return matching_skills[:limit]
+    return [asdict(skill) for skill in matching_skills]
 
 
 if __name__ == "__main__":
@@ -262,3 +428,5 @@ if __name__ == "__main__":
     print(f"\nFound {len(matching)} matching skills:")
     for skill in matching:
         print(f"  - {skill['skill_name']} (relevance: {skill.get('relevance_score', 0)})")
+    
+    _SESSION.close()
@@ -9,6 +9,7 @@ Usage:
     skills-sh-searcher install <skill_dir>     # Install skill
 """
 
+import re
 import sys
 import subprocess
 from pathlib import Path
@@ -20,6 +21,10 @@ sys.path.insert(0, str(scripts_dir))
 from fetch_skills_sh import fetch_skills_sh_leaderboard, search_skills, filter_by_keywords
 from download_skill import download_skill_from_github, install_skill
 
+_GH_URL_RE = re.compile(r'github_url:\s*(https://github\.com/[^\s]+)')
+# github_url lives in the front matter, which fits well inside this
+_HEAD_BYTES = 4096
+
 
 def cmd_search(args):
     """Search for skills"""
@@ -92,10 +97,12 @@ def cmd_install(args):
         if skill_dir_path.exists():
             skill_md = skill_dir_path / 'SKILL.md'
             if skill_md.exists():
-                import re
-                with open(skill_md, 'r') as f:
-                    content = f.read()
-                url_match = re.search(r'github_url:\s*(https://github\.com/[^\s]+)', content)
+                with open(skill_md, 'rb') as f:
+                    head = f.read(_HEAD_BYTES)
+                    url_match = _GH_URL_RE.search(head.decode('utf-8', errors='replace'))
+                    # Read the rest only if the head had no match or may have cut it short
+                    if len(head) == _HEAD_BYTES and (url_match is None or url_match.end() >= len(url_match.string)):
+                        url_match = _GH_URL_RE.search((head + f.read()).decode('utf-8', errors='replace'))
                 if url_match:
                     skill_id = url_match.group(1).replace('https://github.com/', '')
                     print(f"  npx skills add {skill_id}")
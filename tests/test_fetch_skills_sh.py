@@ -0,0 +1,62 @@
+"""Tests for skills.sh leaderboard parsing helpers."""
+
+import importlib.util
+import json
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "test-skills" / "skills-sh-searcher" / "scripts"))
+
+HAVE_DEPS = all(importlib.util.find_spec(name) for name in ("requests", "bs4"))
+
+
+@unittest.skipUnless(HAVE_DEPS, "fetch_skills_sh needs requests and beautifulsoup4")
+class ParseInstallsTest(unittest.TestCase):
+    def setUp(self):
+        from fetch_skills_sh import _parse_installs
+        self.parse = _parse_installs
+
+    def test_suffixes(self):
+        self.assertEqual(self.parse("1.2K"), 1200)
+        self.assertEqual(self.parse("45k installs"), 45000)
+        self.assertEqual(self.parse("3M"), 3_000_000)
+        self.assertEqual(self.parse("2.5 M installs"), 2_500_000)
+
+    def test_thousands_separators(self):
+        self.assertEqual(self.parse("12,345 installs"), 12345)
+
+    def test_following_word_is_not_a_suffix(self):
+        self.assertEqual(self.parse("3 months ago"), 3)
+        self.assertEqual(self.parse("1mcp-builderanthropics/skills"), 1)
+
+    def test_no_number(self):
+        self.assertEqual(self.parse("no installs yet"), 0)
+
+
+@unittest.skipUnless(HAVE_DEPS, "fetch_skills_sh needs requests and beautifulsoup4")
+class FilterLimitTest(unittest.TestCase):
+    def setUp(self):
+        from fetch_skills_sh import filter_by_keywords
+        self.filter = filter_by_keywords
+        self.skills = [
+            {"skill_id": f"o/r/pdf{i}", "skill_name": f"pdf{i}", "installs": i, "skill_url": "u"}
+            for i in range(3)
+        ]
+
+    def test_zero_limit_returns_nothing(self):
+        self.assertEqual(self.filter(self.skills, ["pdf"], limit=0), [])
+        self.assertEqual(self.filter(self.skills, [], limit=0), [])
+
+    def test_no_limit_returns_all_matches(self):
+        self.assertEqual(len(self.filter(self.skills, ["pdf"])), 3)
+        self.assertEqual(len(self.filter(self.skills, ["pdf"], limit=2)), 2)
+
+    def test_results_are_json_serializable_copies(self):
+        results = self.filter(self.skills, ["pdf"])
+        self.assertEqual(json.loads(json.dumps(results))[0]["relevance_score"], 3)
+        self.assertNotIn("relevance_score", self.skills[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
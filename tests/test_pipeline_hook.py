@@ -0,0 +1,132 @@
+"""Tests for the pipeline quality gate's report cache."""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest import mock
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT / "skills" / "ontos-skill-evaluator" / "scripts"))
+
+import pipeline_hook  # noqa: E402
+from pipeline_hook import SkillQualityGate  # noqa: E402
+from quick_eval import EvaluationReport, TokenWarning, evaluate_skill  # noqa: E402
+
+
+class CachedGateTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.skill = self.root / "weather"
+        shutil.copytree(REPO_ROOT / "test-skills" / "weather", self.skill)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _patch_evaluate(self):
+        """Count evaluate_skill calls; a plain function, since the cache key reads its __code__."""
+        calls = []
+
+        def counting_evaluate(skill_path, *args, **kwargs):
+            calls.append(skill_path)
+            return evaluate_skill(skill_path, *args, **kwargs)
+
+        patcher = mock.patch.object(pipeline_hook, "evaluate_skill", counting_evaluate)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return calls
+
+    def test_unchanged_skill_is_read_from_cache(self):
+        calls = self._patch_evaluate()
+        cache_dir = self.root / "cache"
+        gate = SkillQualityGate(generate_report=False, cache_dir=cache_dir)
+        first = gate.evaluate(self.skill).report
+        (cache_path,) = cache_dir.iterdir()
+        self.assertEqual(cache_path.name, f"{pipeline_hook._cache_key(self.skill.resolve())}.json")
+
+        # Mark the entry, so the second result shows it came from the file
+        entry = json.loads(cache_path.read_text(encoding="utf-8"))
+        entry["evaluated_at"] = "from-cache"
+        cache_path.write_text(json.dumps(entry), encoding="utf-8")
+
+        second = gate.evaluate(self.skill).report
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(second.evaluated_at, "from-cache")
+        self.assertEqual({**second.to_dict(), "evaluated_at": first.evaluated_at}, first.to_dict())
+
+    def test_edited_or_added_files_invalidate_entry(self):
+        calls = self._patch_evaluate()
+        gate = SkillQualityGate(generate_report=False, cache_dir=self.root / "cache")
+        gate.evaluate(self.skill)
+
+        skill_md = self.skill / "SKILL.md"
+        skill_md.write_text(skill_md.read_text(encoding="utf-8") + "\nEdited.\n", encoding="utf-8")
+        gate.evaluate(self.skill)
+        self.assertEqual(len(calls), 2)
+
+        (self.skill / "notes.txt").write_text("new file", encoding="utf-8")
+        gate.evaluate(self.skill)
+        self.assertEqual(len(calls), 3)
+
+        gate.evaluate(self.skill)
+        self.assertEqual(len(calls), 3)
+
+    def test_concurrent_evaluations_share_empty_cache(self):
+        gate = SkillQualityGate(generate_report=False, cache_dir=self.root / "cache")
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            scores = list(executor.map(lambda _: gate.evaluate(self.skill).score, range(16)))
+        self.assertEqual(len(set(scores)), 1)
+        self.assertEqual([p.suffix for p in (self.root / "cache").iterdir()], [".json"])
+
+    @unittest.skipUnless(hasattr(os, "symlink"), "needs symlink support")
+    def test_dangling_symlink_in_skill(self):
+        os.symlink(self.root / "missing", self.skill / "dangling")
+        gate = SkillQualityGate(generate_report=False, cache_dir=self.root / "cache")
+        self.assertIsNotNone(gate.evaluate(self.skill).score)
+
+    def test_unwritable_cache_does_not_fail_evaluation(self):
+        blocker = self.root / "not-a-dir"
+        blocker.touch()
+        gate = SkillQualityGate(generate_report=False, cache_dir=blocker / "cache")
+        self.assertIsNotNone(gate.evaluate(self.skill).score)
+
+
+class ReportRoundTripTest(unittest.TestCase):
+    def test_to_dict_from_dict_round_trip(self):
+        report = evaluate_skill(REPO_ROOT / "test-skills" / "weather")
+        report.token_warnings.append(TokenWarning("body_lines", 320, 300, "warning", "long body"))
+        report.recommendations.append("Reduce skill size")
+        data = report.to_dict()
+        self.assertTrue(data["issues"])
+
+        restored = EvaluationReport.from_dict(json.loads(json.dumps(data)))
+        self.assertEqual(restored.to_dict(), data)
+
+
+class HtmlReportTest(unittest.TestCase):
+    def test_failed_render_keeps_previous_report(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            out = Path(tmp)
+            skill = out / "weather"
+            shutil.copytree(REPO_ROOT / "test-skills" / "weather", skill)
+            gate = SkillQualityGate(report_output_dir=out)
+            html_path = gate.evaluate(skill).html_report_path
+            previous = html_path.read_bytes()
+
+            def failing_renderer(report, fp):
+                fp.write("<partial")
+                raise RuntimeError("render failed")
+
+            with mock.patch.object(pipeline_hook, "_load_html_renderer", return_value=failing_renderer):
+                self.assertIsNone(gate.evaluate(skill).html_report_path)
+            self.assertEqual(html_path.read_bytes(), previous)
+            self.assertEqual(sorted(p.name for p in out.iterdir()), ["weather", "weather_report.html"])
+
+
+if __name__ == "__main__":
+    unittest.main()
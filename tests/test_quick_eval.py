@@ -0,0 +1,69 @@
+"""Regression tests for the Python Quick Eval engine."""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "skills" / "ontos-skill-evaluator" / "scripts"))
+
+from quick_eval import evaluate_batch, evaluate_skill, parse_frontmatter  # noqa: E402
+
+
+def _write_skill(root: Path, name: str, frontmatter: str, body: str = "# Skill\n\nBody text.\n") -> Path:
+    skill_dir = root / name
+    skill_dir.mkdir()
+    (skill_dir / "SKILL.md").write_text(f"---\n{frontmatter}---\n{body}", encoding="utf-8")
+    return skill_dir
+
+
+class NonScalarFrontmatterTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_list_description_is_reported_not_raised(self):
+        skill_dir = _write_skill(self.root, "listy", "name: listy\ndescription:\n  - Use when foo\n")
+        report = evaluate_skill(skill_dir)
+        self.assertIn("INVALID_FIELD_TYPE", [i.code for i in report.issues])
+
+    def test_mapping_description_is_reported_not_raised(self):
+        skill_dir = _write_skill(self.root, "mappy", "name: mappy\ndescription: {a: b}\n")
+        report = evaluate_skill(skill_dir)
+        self.assertIn("INVALID_FIELD_TYPE", [i.code for i in report.issues])
+
+    def test_batch_survives_non_scalar_fields(self):
+        _write_skill(self.root, "listy", "name: [a, b]\ndescription:\n  - Use when foo\n")
+        _write_skill(self.root, "plain", "name: plain\ndescription: Use when testing plain skills.\n")
+        reports = evaluate_batch(self.root)
+        self.assertEqual(sorted(r.skill_id for r in reports), ["listy", "plain"])
+
+
+class ScalarTextTest(unittest.TestCase):
+    def test_scalars_keep_their_source_text(self):
+        frontmatter, _, issues = parse_frontmatter(
+            "---\nname: yes\ndescription: 1.10\nlicense: 0777\ntags:\n---\nBody\n"
+        )
+        self.assertEqual(
+            frontmatter,
+            {"name": "yes", "description": "1.10", "license": "0777", "tags": ""},
+        )
+        self.assertNotIn("INVALID_FIELD_TYPE", [i.code for i in issues])
+
+
+class ToolRefsTest(unittest.TestCase):
+    def test_hidden_file_counts_as_scripts_content(self):
+        # Path.glob("*") lists dotfiles, so the original check scored .gitkeep
+        with tempfile.TemporaryDirectory() as tmp:
+            skill_dir = _write_skill(Path(tmp), "hidden", "name: hidden\ndescription: Use when checking scripts.\n")
+            (skill_dir / "scripts").mkdir()
+            (skill_dir / "scripts" / ".gitkeep").touch()
+            report = evaluate_skill(skill_dir)
+        self.assertEqual(report.scores.tool_refs, 0.3)
+
+
+if __name__ == "__main__":
+    unittest.main()
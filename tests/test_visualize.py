@@ -0,0 +1,75 @@
+"""Tests for the HTML report renderer."""
+
+import json
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "skills" / "ontos-skill-evaluator" / "scripts"))
+
+import visualize  # noqa: E402
+from visualize import generate_html_report, generate_modal_html, iter_html_report, iter_html_report_bytes  # noqa: E402
+
+NON_STRING_REPORT = {
+    "skill_id": None,
+    "scores": {},
+    "issues": [{"severity": "error", "message": None, "code": 3, "suggestion": 5}],
+    "recommendations": [1, "<b>escaped</b>"],
+}
+
+
+class NonStringValuesTest(unittest.TestCase):
+    def test_html_report_renders_non_strings(self):
+        html = generate_html_report(NON_STRING_REPORT)
+        self.assertIn("&lt;b&gt;escaped&lt;/b&gt;", html)
+        self.assertEqual(b"".join(iter_html_report_bytes(NON_STRING_REPORT)), html.encode("utf-8"))
+
+    def test_modal_renders_non_strings(self):
+        self.assertIn("None", generate_modal_html(NON_STRING_REPORT)["issues_html"])
+
+
+class EscapingTest(unittest.TestCase):
+    def test_badge_timestamp_and_tier_are_escaped(self):
+        html = generate_html_report({
+            "badge": 'x"><script>1</script>',
+            "evaluated_at": "<img src=x onerror=alert(1)>",
+            "tier": "<i>quick</i>",
+        })
+        self.assertNotIn("<script>1", html)
+        self.assertNotIn("<img src=x", html)
+        self.assertNotIn("<i>quick", html)
+        self.assertIn('badge-x&quot;&gt;&lt;script&gt;1&lt;/script&gt;"', html)
+        self.assertIn("X&quot;&gt;&lt;SCRIPT&gt;1&lt;/SCRIPT&gt;", html)
+        self.assertIn("&lt;img src=x onerror=alert(1)&gt;", html)
+
+
+class EagerValuesTest(unittest.TestCase):
+    def test_bad_report_raises_before_first_chunk(self):
+        # Callers open their output file after this call; it must fail first
+        bad = {"scores": {"overall": None}}
+        with self.assertRaises(TypeError):
+            iter_html_report(bad)
+        with self.assertRaises(TypeError):
+            iter_html_report_bytes(bad)
+
+
+
+@unittest.skipUnless(visualize.msgspec, "msgspec not installed")
+class StructDecodeTest(unittest.TestCase):
+    def test_struct_values_match_dict_values(self):
+        full = {
+            "skill_id": "weather",
+            "badge": "silver",
+            "scores": {"overall": 0.81, "structure": 1, "triggers": 0.5, "examples": 0.25},
+            "issues": [{"severity": "warning", "message": "m", "code": "C"}],
+            "recommendations": ["r"],
+            "evaluated_at": "2026-01-01T00:00:00Z",
+            "passed": True,
+        }
+        for report in (full, NON_STRING_REPORT, {}):
+            raw = json.dumps(report).encode("utf-8")
+            decoded = visualize.msgspec.json.decode(raw, type=visualize._Report)
+            self.assertEqual(visualize._struct_template_values(decoded), visualize._template_values(report))
+
+if __name__ == "__main__":
+    unittest.main()